@@ -27,6 +27,24 @@ Encoding = str
 NewLine = str
 
 
+def _decode(source_code_buf: io.BytesIO) -> Tuple[FileContent, Encoding, NewLine]:
+    # Decode the given source code buffer with encoding and new line detection.
+    encoding, lines = tokenize.detect_encoding(source_code_buf.readline)
+    if not lines:
+        return "", encoding, LF
+
+    newline = CRLF if CRLF.encode() == lines[0][-2:] else LF
+    source_code_buf.seek(0)
+    with io.TextIOWrapper(source_code_buf, encoding) as wrapper:
+        source_code = wrapper.read()
+
+    if FORM_FEED_CHAR in source_code:
+        raise ValueError(
+            "Pycln can not handle a file containing a form feed character (\\f)"
+        )
+    return source_code, encoding, newline
+
+
 def read_stdin() -> Tuple[FileContent, Encoding, NewLine]:
     """Read the content of STDIN with encoding and new line type detection.
 
@@ -35,21 +53,7 @@ def read_stdin() -> Tuple[FileContent, Encoding, NewLine]:
         or some rare characters presented.
     """
     try:
-        source_code_buf = io.BytesIO(sys.stdin.buffer.read())
-        encoding, lines = tokenize.detect_encoding(source_code_buf.readline)
-        if not lines:
-            return "", encoding, LF
-
-        newline = CRLF if CRLF.encode() == lines[0][-2:] else LF
-        source_code_buf.seek(0)
-        with io.TextIOWrapper(source_code_buf, encoding) as wrapper:
-            source_code = wrapper.read()
-
-        if FORM_FEED_CHAR in source_code:
-            raise ValueError(
-                "Pycln can not handle a file containing a form feed character (\\f)"
-            )
-        return source_code, encoding, newline
+        return _decode(io.BytesIO(sys.stdin.buffer.read()))
     except (SyntaxError, ValueError) as err:
         raise UnparsableFile(STDIN_FILE, err) from err
 
@@ -70,28 +74,25 @@ def safe_read(
     :raises InitFileDoesNotExistError: when `path` is a path to a non-existing
         `__init__.py` file.
     """
-    # Check for a non-existing `__init__.py` file case.
-    if str(path).endswith(__INIT__) and not path.exists():
-        raise InitFileDoesNotExistError(2, "`__init__.py` file does not exist", path)
-
-    # Check these permissions before openinig the file.
-    for permission in permissions:
-        if not os.access(path, permission):
-            if permission is os.R_OK:
-                raise ReadPermissionError(13, "Permission denied [READ]", path)
-            elif permission is os.W_OK:
-                raise WritePermissionError(13, "Permission denied [WRITE]", path)
+    # Let opening the file report read errors, instead of checking it upfront.
+    try:
+        with open(path, "rb") as stream:
+            source_code_buf = io.BytesIO(stream.read())
+    except (FileNotFoundError, NotADirectoryError, PermissionError) as err:
+        # Check for a non-existing `__init__.py` file case.
+        if str(path).endswith(__INIT__) and not isinstance(err, PermissionError):
+            raise InitFileDoesNotExistError(
+                2, "`__init__.py` file does not exist", path
+            ) from err
+        if os.R_OK in permissions:
+            raise ReadPermissionError(13, "Permission denied [READ]", path) from err
+        raise
+
+    if os.W_OK in permissions and not os.access(path, os.W_OK):
+        raise WritePermissionError(13, "Permission denied [WRITE]", path)
+
     try:
-        with tokenize.open(path) as stream:
-            source_code = stream.read()
-            encoding = stream.encoding
-        if FORM_FEED_CHAR in source_code:
-            raise ValueError(
-                "Pycln can not handle a file containing a form feed character (\\f)"
-            )
-        with open(path, "rb") as f:
-            newline = CRLF if CRLF.encode() == f.readline()[-2:] else LF
-        return source_code, encoding, newline
+        return _decode(source_code_buf)
     except (SyntaxError, ValueError) as err:
         raise UnparsableFile(path, err) from err
 
@@ -3,7 +3,7 @@ import ast
 import os
 import sys
 from importlib import import_module
-from typing import Iterable, List, Optional, Set, Tuple, Union, cast
+from typing import List, Optional, Set, Tuple, Union, cast
 
 from .. import ISWIN
 from . import iou, pathu, regexu, scan
@@ -34,6 +34,7 @@ NOPYCLN = "nopycln"
 CHANGE_MARK = "\n_CHANGED_"
 TRANSFORM = ".transform"
 PYCLN_UTILS = "pycln.utils"
+STMT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
 
 
 class PyPath(Path):
@@ -93,13 +94,13 @@ class Refactor:
         self.configs = configs
         self.reporter = reporter
         # Resetables.
-        self._import_stats = scan.ImportStats(set(), set())
+        self._import_stats = scan.ImportStats([], [])
         self._source_stats = scan.SourceStats(set(), set(), set())
         self._path = PyPath("")
         self._is_init_without_all = False
 
     def _reset(self) -> None:
-        self._import_stats = scan.ImportStats(set(), set())
+        self._import_stats = scan.ImportStats([], [])
         self._source_stats = scan.SourceStats(set(), set(), set())
         self._path = PyPath("")
         self._is_init_without_all = False
@@ -112,11 +113,8 @@ class Refactor:
         :returns: clean source code lines.
         """
 
-        def remove_from_children(
-            parent: ast.AST, children: Iterable, body_len: int, wl: Set[ast.AST]
-        ):
-            #: Remove any `ast.Pass` node
-            #: that is both useless and not in the `wl` (white list).
+        def remove_from_children(parent: ast.AST, children: List[ast.AST]):
+            #: Remove any `ast.Pass` node that is useless.
             #:
             #: The case below is not going to be touched:
             #:
@@ -124,39 +122,29 @@ class Refactor:
             #: >>>      """DOCString"""
             #: >>>      pass
             #:
+            children_len = len(children)
             for child in children:
                 if isinstance(child, ast.Pass):
-                    if child not in wl:
-                        if isinstance(
-                            parent,
-                            (ast.AsyncFunctionDef, ast.FunctionDef, ast.ClassDef),
-                        ):
-                            if body_len == 2 and ast.get_docstring(parent):
-                                break
-                        if body_len > 1:
-                            body_len -= 1
-                            source_lines[child.lineno - 1] = ""
-
-        tree = ast.parse("".join(source_lines))
-        for parent in ast.walk(tree):
-            body = getattr(parent, "body", None)
-            if body and hasattr(body, "__len__"):
-                body_len = len(body)
-                white_list: Set[ast.AST] = set()
-
-                if hasattr(parent, "orelse"):
-                    orelse = getattr(parent, "orelse")
-                    remove_from_children(parent, orelse, len(orelse), white_list)
-                    white_list |= set(orelse)
-
-                if hasattr(parent, "finalbody"):
-                    finalbody = getattr(parent, "finalbody")
-                    remove_from_children(parent, finalbody, len(finalbody), white_list)
-                    white_list |= set(finalbody)
-
-                children = ast.iter_child_nodes(parent)
-                remove_from_children(parent, children, body_len, white_list)
-
+                    if isinstance(
+                        parent,
+                        (ast.AsyncFunctionDef, ast.FunctionDef, ast.ClassDef),
+                    ):
+                        if children_len == 2 and ast.get_docstring(parent):
+                            break
+                    if children_len > 1:
+                        children_len -= 1
+                        source_lines[child.lineno - 1] = ""
+
+        def visit(parent: ast.AST):
+            # `pass` is a statement, so only statements lists are walked.
+            for field in STMT_FIELDS:
+                children = getattr(parent, field, None)
+                if children:
+                    remove_from_children(parent, children)
+                    for child in children:
+                        visit(child)
+
+        visit(ast.parse("".join(source_lines)))
         return "".join(source_lines).splitlines(True)
 
     def session(self, path: Path) -> None:
@@ -1,12 +1,13 @@
 """Pycln source code AST analysis utility."""
 import ast
+import copy
 import os
 import sys
 from dataclasses import dataclass
 from enum import Enum, unique
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Set, Tuple, TypeVar, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, Union, cast
 
 from . import _nodes, iou, pathu
 from ._exceptions import ReadPermissionError, UnexpandableImportStar, UnparsableFile
@@ -14,6 +15,10 @@ from ._exceptions import ReadPermissionError, UnexpandableImportStar, Unparsable
 # Constants.
 PY38_PLUS = sys.version_info >= (3, 8)
 PY39_PLUS = sys.version_info >= (3, 9)
+UNKNOWN = "<unknown>"
+#: Include type_comments when Python >=3.8.
+#: For more information https://www.python.org/dev/peps/pep-0526/ .
+PARSE_FLAGS = ast.PyCF_ONLY_AST | (ast.PyCF_TYPE_COMMENTS if PY38_PLUS else 0)
 __ALL__ = "__all__"
 NAMES_TO_SKIP = frozenset(
     {
@@ -90,6 +95,10 @@ FunctionT = TypeVar("FunctionT", bound=Callable[..., Any])
 FunctionDefT = TypeVar(
     "FunctionDefT", bound=Union[ast.FunctionDef, ast.AsyncFunctionDef]
 )
+ChildFieldsT = Tuple[Tuple[str, bool], ...]
+
+#: `type(node)` -> ((field name, is list), ...). Filled by `get_child_fields`.
+_CHILD_FIELDS: Dict[type, ChildFieldsT] = {}
 
 
 def recursive(func: FunctionT) -> FunctionT:
@@ -106,13 +115,92 @@ def recursive(func: FunctionT) -> FunctionT:
     return cast(FunctionT, wrapper)
 
 
+def get_child_fields(node: ast.AST) -> ChildFieldsT:
+    """Get the names of the given node fields that may hold child nodes.
+
+    Fields are classified once per node type, from the first node seen with
+    all of its fields set, into list fields (statements, expressions, ...) and
+    node fields (a single, possibly optional, child node). Scalar fields
+    (identifiers, constants, ...) are left out. The original fields order is
+    kept.
+
+    :param node: an `ast.AST` node.
+    :returns: tuple of (field name, is list field) pairs.
+    """
+    node_type = type(node)
+    child_fields = _CHILD_FIELDS.get(node_type)
+    if child_fields is None:
+        fields: List[Tuple[str, bool]] = []
+        is_complete = True
+        for field in node._fields:
+            if not hasattr(node, field):
+                # Can't be classified (e.g. a manually built node).
+                is_complete = False
+                continue
+            value = getattr(node, field)
+            if isinstance(value, list):
+                fields.append((field, True))
+            elif value is None or isinstance(value, ast.AST):
+                fields.append((field, False))
+        child_fields = tuple(fields)
+        if is_complete:
+            _CHILD_FIELDS[node_type] = child_fields
+    return child_fields
+
+
+class DispatchNodeVisitor(ast.NodeVisitor):
+
+    """`ast.NodeVisitor` with a precomputed `visit_*` dispatch table.
+
+    `ast.NodeVisitor.visit` builds the `"visit_" + class name` string
+    and calls `getattr` for every visited node, this class maps
+    `type(node)` to its bound `visit_*` method once per instance instead.
+
+    Child nodes are dispatched through `_visit`, so an overridden `visit`
+    is only called for the node the walk starts at.
+    """
+
+    def __init__(self) -> None:
+        self._dispatch: Dict[type, Callable[[ast.AST], Any]] = {}
+        for attr in dir(self):
+            if attr.startswith("visit_"):
+                # Skip AST nodes which aren't supported by the running Python.
+                node_type = getattr(ast, attr[6:], None)
+                if isinstance(node_type, type):
+                    self._dispatch[node_type] = getattr(self, attr)
+
+    def visit(self, node: ast.AST) -> Any:
+        """Visit a node (override)."""
+        return self._visit(node)
+
+    def _visit(self, node: ast.AST) -> Any:
+        return self._dispatch.get(type(node), self.generic_visit)(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Called if no explicit visitor function exists for a node
+        (override)."""
+        # Iterate the pre-classified fields instead of `ast.iter_fields`.
+        visit = self._visit
+        for field, is_list in get_child_fields(node):
+            if is_list:
+                for item in getattr(node, field, ()):
+                    if isinstance(item, ast.AST):
+                        visit(item)
+            else:
+                value = getattr(node, field, None)
+                if isinstance(value, ast.AST):
+                    visit(value)
+
+
 @dataclass
 class ImportStats:
 
     """Import statements statistics."""
 
-    import_: Set[_nodes.Import]
-    from_: Set[_nodes.ImportFrom]
+    __slots__ = ("import_", "from_")
+
+    import_: List[_nodes.Import]
+    from_: List[_nodes.ImportFrom]
 
     def __iter__(self):
         return iter([self.import_, self.from_])
@@ -123,6 +211,8 @@ class SourceStats:
 
     """Source code (`ast.Name`, `ast.Attribute`) statistics."""
 
+    __slots__ = ("name_", "attr_", "names_to_skip")
+
     #: Included on `__iter__`.
     name_: Set[str]
     attr_: Set[str]
@@ -134,7 +224,7 @@ class SourceStats:
         return iter([self.name_, self.attr_])
 
 
-class SourceAnalyzer(ast.NodeVisitor):
+class SourceAnalyzer(DispatchNodeVisitor):
 
     """AST source code analyzer.
 
@@ -156,41 +246,42 @@ class SourceAnalyzer(ast.NodeVisitor):
         if not PY38_PLUS and source_lines is None:
             # Bad class usage.
             raise ValueError("Please provide source lines for Python < 3.8.")
+        super().__init__()
         self._has_all = False  # True if the source has an `__all__` dunder.
         self._lines = source_lines
-        self._import_stats = ImportStats(set(), set())
+        self._import_stats = ImportStats([], [])
         self._imports_to_skip: Set[Union[_nodes.Import, _nodes.ImportFrom]] = set()
         self._source_stats = SourceStats(set(), set(), set())
 
     @recursive
-    def visit_Import(self, node: ast.Import):
+    def visit_Import(self, node: ast.Import) -> None:
         if node not in self._imports_to_skip:
             py38_node = self._get_py38_import_node(node)
-            self._import_stats.import_.add(py38_node)
+            self._import_stats.import_.append(py38_node)
 
     @recursive
-    def visit_ImportFrom(self, node: ast.ImportFrom):
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         if node not in self._imports_to_skip:
             py38_node = self._get_py38_import_from_node(node)
             if not str(py38_node.module).startswith("__"):
-                self._import_stats.from_.add(py38_node)
+                self._import_stats.from_.append(py38_node)
 
     @recursive
-    def visit_Name(self, node: ast.Name):
+    def visit_Name(self, node: ast.Name) -> None:
         self._source_stats.name_.add(node.id)
 
     @recursive
-    def visit_Attribute(self, node: ast.Attribute):
+    def visit_Attribute(self, node: ast.Attribute) -> None:
         self._source_stats.attr_.add(node.attr)
 
     @recursive
-    def visit_MatchAs(self, node: "ast.MatchAs"):  # type: ignore
+    def visit_MatchAs(self, node: "ast.MatchAs") -> None:  # type: ignore
         #: Support Match statement (PYTHON >= 3.10).
         #: PEP0634: https://www.python.org/dev/peps/pep-0634/
         self._source_stats.name_.add(node.name)
 
     @recursive
-    def visit_Call(self, node: ast.Call):
+    def visit_Call(self, node: ast.Call) -> None:
         func = node.func
 
         #: Support casting case.
@@ -251,7 +342,7 @@ class SourceAnalyzer(ast.NodeVisitor):
                     self._parse_string(elt)  # type: ignore
 
     @recursive
-    def visit_AnnAssign(self, node: ast.AnnAssign):
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
         #: Support all
         #:
         #: 1) string type annotations:
@@ -275,7 +366,7 @@ class SourceAnalyzer(ast.NodeVisitor):
             self._parse_string(node.value)  # type: ignore
 
     @recursive
-    def visit_arg(self, node: ast.arg):
+    def visit_arg(self, node: ast.arg) -> None:
         # Support Python ^3.8 type comments.
         self._visit_type_comment(node)
         #: Support all
@@ -294,7 +385,7 @@ class SourceAnalyzer(ast.NodeVisitor):
         self._visit_string_type_annotation(node)
 
     @recursive
-    def visit_FunctionDef(self, node: FunctionDefT):
+    def visit_FunctionDef(self, node: FunctionDefT) -> None:
         # Support Python ^3.8 type comments.
         self._visit_type_comment(node)
         #: Support all
@@ -316,7 +407,7 @@ class SourceAnalyzer(ast.NodeVisitor):
     visit_AsyncFunctionDef = visit_FunctionDef
 
     @recursive
-    def visit_ClassDef(self, node: ast.ClassDef):
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
         #: Support imports used in generics and wrapped in string:
         #:
         #: >>> from typing import Generic
@@ -339,7 +430,7 @@ class SourceAnalyzer(ast.NodeVisitor):
                     self._parse_string(elt)  # type: ignore
 
     @recursive
-    def visit_Assign(self, node: ast.Assign):
+    def visit_Assign(self, node: ast.Assign) -> None:
         # Support Python ^3.8 type comments.
         self._visit_type_comment(node)
         id_ = getattr(node.targets[0], "id", None)
@@ -368,7 +459,7 @@ class SourceAnalyzer(ast.NodeVisitor):
                 self._add_concatenated_list_names(node.value)
 
     @recursive
-    def visit_AugAssign(self, node: ast.AugAssign):
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
         id_ = getattr(node.target, "id", None)
         # Support `__all__` with `+=` operator case.
         if id_ == __ALL__:
@@ -391,7 +482,7 @@ class SourceAnalyzer(ast.NodeVisitor):
                 self._add_concatenated_list_names(node.value)
 
     @recursive
-    def visit_Expr(self, node: ast.Expr):
+    def visit_Expr(self, node: ast.Expr) -> None:
         #: Support `__all__` dunder overriding with
         #: `append` and `extend` operations:
         #:
@@ -503,7 +594,9 @@ class SourceAnalyzer(ast.NodeVisitor):
                 if value and isinstance(value, str):
                     self._source_stats.name_.add(value)
 
-    def _add_name_attr_const(self, tree: ast.AST, is_str_annotation: bool = False):
+    def _add_name_attr_const(
+        self, tree: ast.AST, is_str_annotation: bool = False
+    ) -> None:
         # Add any `ast.Name`, `ast.Attribute`, and (`ast.Constant` if is_str_annotation)
         # child to `self._source_stats`.
         for node in ast.walk(tree):
@@ -588,7 +681,7 @@ class SourceAnalyzer(ast.NodeVisitor):
         return self._has_all
 
 
-class ImportablesAnalyzer(ast.NodeVisitor):
+class ImportablesAnalyzer(DispatchNodeVisitor):
 
     """Get set of all importable names from given `ast.Module`.
 
@@ -604,13 +697,15 @@ class ImportablesAnalyzer(ast.NodeVisitor):
     """
 
     def __init__(self, path: Path):
-        self._not_importables: Set[Union[ast.Name, str]] = set()
+        super().__init__()
+        #: Class/function names and `id()`s of their assignment targets.
+        self._not_importables: Set[Union[int, str]] = set()
         self._importables: Set[str] = set()
         self._has_all = False  # True if the source has an `__all__` dunder.
         self._path = path
 
     @recursive
-    def visit_Assign(self, node: ast.Assign):
+    def visit_Assign(self, node: ast.Assign) -> None:
         id_ = getattr(node.targets[0], "id", None)
         # Support `__all__` dunder overriding cases.
         if id_ == __ALL__:
@@ -635,7 +730,7 @@ class ImportablesAnalyzer(ast.NodeVisitor):
                 self._add_concatenated_list_names(node.value)
 
     @recursive
-    def visit_AugAssign(self, node: ast.AugAssign):
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
         id_ = getattr(node.target, "id", None)
         # Support `__all__` with `+=` operator case.
         if id_ == __ALL__:
@@ -658,7 +753,7 @@ class ImportablesAnalyzer(ast.NodeVisitor):
                 self._add_concatenated_list_names(node.value)
 
     @recursive
-    def visit_Expr(self, node: ast.Expr):
+    def visit_Expr(self, node: ast.Expr) -> None:
         #: Support `__all__` dunder overriding with
         #: `append` and `extend` operations:
         #:
@@ -685,18 +780,21 @@ class ImportablesAnalyzer(ast.NodeVisitor):
                         self._add_list_names(arg.elts)
 
     @recursive
-    def visit_Import(self, node: ast.Import):
+    def visit_Import(self, node: ast.Import) -> None:
         # Analyze each import statement.
         for alias in node.names:
             name = alias.asname if alias.asname else alias.name
             self._importables.add(name)
 
     @recursive
-    def visit_ImportFrom(self, node: ast.ImportFrom):
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         # Analyze each importFrom statement.
         try:
             if node.names[0].name == "*":
-                # Expand import star if possible.
+                # Expand import star if possible. The expansion is done on a
+                # copy as `node` may belong to a cached (shared) tree.
+                node = copy.copy(node)
+                node.names = list(node.names)
                 node = cast(ast.ImportFrom, expand_import_star(node, self._path))
             for alias in node.names:
                 name = alias.asname if alias.asname else alias.name
@@ -706,7 +804,7 @@ class ImportablesAnalyzer(ast.NodeVisitor):
             pass  # pragma: no cover
 
     @recursive
-    def visit_FunctionDef(self, node: FunctionDefT):
+    def visit_FunctionDef(self, node: FunctionDefT) -> None:
         # Add function name as importable name.
         if node.name not in self._not_importables:
             self._importables.add(node.name)
@@ -716,17 +814,17 @@ class ImportablesAnalyzer(ast.NodeVisitor):
     visit_AsyncFunctionDef = visit_FunctionDef
 
     @recursive
-    def visit_ClassDef(self, node: ast.ClassDef):
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
         # Add class name as importable name.
         if node.name not in self._not_importables:
             self._importables.add(node.name)
         self._compute_not_importables(node)
 
     @recursive
-    def visit_Name(self, node: ast.Name):
+    def visit_Name(self, node: ast.Name) -> None:
         if isinstance(node.ctx, ast.Store):
             # Except not-importables.
-            if node not in self._not_importables:
+            if id(node) not in self._not_importables:
                 self._importables.add(node.id)
 
     def _add_concatenated_list_names(self, node: ast.BinOp) -> None:
@@ -748,15 +846,15 @@ class ImportablesAnalyzer(ast.NodeVisitor):
                 if value and isinstance(value, str):
                     self._importables.add(value)
 
-    def _compute_not_importables(self, node: Union[FunctionDefT, ast.ClassDef]):
+    def _compute_not_importables(self, node: Union[FunctionDefT, ast.ClassDef]) -> None:
         # Compute class/function not-importables.
-        for node_ in ast.iter_child_nodes(node):
+        for node_ in node.body:
             if isinstance(node_, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
                 self._not_importables.add(cast(str, node_.name))
 
             if isinstance(node_, ast.Assign):
                 for target in node_.targets:
-                    self._not_importables.add(cast(ast.Name, target))
+                    self._not_importables.add(id(target))
 
     def get_stats(self) -> Set[str]:
         if self._path.name == "__init__.py":
@@ -766,18 +864,12 @@ class ImportablesAnalyzer(ast.NodeVisitor):
                     self._importables.add(path.split(".")[0])
         return self._importables
 
-    def generic_visit(self, node):
+    def generic_visit(self, node: ast.AST) -> None:
         """Called if no explicit visitor function exists for a node
         (override)."""
         # Continue visiting if only if `__all__` has not overridden.
         if (not self._has_all) or isinstance(node, ast.AugAssign):
-            for _, value in ast.iter_fields(node):
-                if isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, ast.AST):
-                            self.visit(item)
-                elif isinstance(value, ast.AST):
-                    self.visit(value)
+            super().generic_visit(node)
 
 
 @unique
@@ -796,7 +888,11 @@ class HasSideEffects(Enum):
     NOT_KNOWN = -2
 
 
-class SideEffectsAnalyzer(ast.NodeVisitor):
+class _SideEffectsFound(Exception):
+    """Raises to stop `SideEffectsAnalyzer` visiting once a side effect found."""
+
+
+class SideEffectsAnalyzer(DispatchNodeVisitor):
 
     """Check if the given `ast.Module` has side effects or not.
 
@@ -809,12 +905,27 @@ class SideEffectsAnalyzer(ast.NodeVisitor):
     >>> has_side_effects = analyzer.has_side_effects()
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
+        super().__init__()
         self._not_side_effects: Set[ast.Call] = set()
         self._has_side_effects = HasSideEffects.NO
 
+    def visit(self, node: ast.AST) -> None:
+        """Visit a node (override)."""
+        # Nothing can change a known side effect, so stop the whole walk
+        # at once instead of unwinding visitor by visitor.
+        try:
+            self._visit(node)
+        except _SideEffectsFound:
+            pass
+
+    def _set_has_side_effects(self, has_side_effects: HasSideEffects) -> None:
+        self._has_side_effects = has_side_effects
+        if has_side_effects is HasSideEffects.YES:
+            raise _SideEffectsFound()
+
     @recursive
-    def visit_FunctionDef(self, node: FunctionDefT):
+    def visit_FunctionDef(self, node: FunctionDefT) -> None:
         # Mark any call inside a function as not-side-effect.
         self._compute_not_side_effects(node)
 
@@ -822,7 +933,7 @@ class SideEffectsAnalyzer(ast.NodeVisitor):
     visit_AsyncFunctionDef = visit_FunctionDef
 
     @recursive
-    def visit_ClassDef(self, node: ast.ClassDef):
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
         # Mark any call inside a class as not-side-effect.
         self._compute_not_side_effects(node)
 
@@ -830,39 +941,41 @@ class SideEffectsAnalyzer(ast.NodeVisitor):
         self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]
     ) -> None:
         # Mark any call inside the given `node` as not-side-effect.
-        for node_ in ast.iter_child_nodes(node):
+        for node_ in node.body:
             if isinstance(node_, ast.Expr):
                 if isinstance(node_.value, ast.Call):
                     self._not_side_effects.add(node_.value)
 
     @recursive
-    def visit_Call(self, node: ast.Call):
+    def visit_Call(self, node: ast.Call) -> None:
         if node not in self._not_side_effects:
-            self._has_side_effects = HasSideEffects.YES
+            self._set_has_side_effects(HasSideEffects.YES)
 
     @recursive
-    def visit_Import(self, node: ast.Import):
-        self._has_side_effects = SideEffectsAnalyzer._check_names(node.names)
+    def visit_Import(self, node: ast.Import) -> None:
+        self._set_has_side_effects(SideEffectsAnalyzer._check_names(node.names))
 
     @recursive
-    def visit_ImportFrom(self, node: ast.ImportFrom):
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         packages = node.module.split(".") if node.module else []
         packages_aliases = [ast.alias(name=name, asname=None) for name in packages]
-        self._has_side_effects = SideEffectsAnalyzer._check_names(packages_aliases)
+        self._set_has_side_effects(SideEffectsAnalyzer._check_names(packages_aliases))
         if self._has_side_effects is HasSideEffects.NO:
-            self._has_side_effects = SideEffectsAnalyzer._check_names(node.names)
+            self._set_has_side_effects(SideEffectsAnalyzer._check_names(node.names))
 
     @staticmethod
     def _check_names(names: List[ast.alias]) -> HasSideEffects:
         # Check if imported names has side effects or not.
+        stdlib_names = pathu.get_standard_lib_names()
+        imports_with_side_effects = pathu.IMPORTS_WITH_SIDE_EFFECTS
         for alias in names:
             # All standard lib modules doesn't has side effects
             # except `pathu.IMPORTS_WITH_SIDE_EFFECTS`.
-            if alias.name in pathu.get_standard_lib_names():
+            if alias.name in stdlib_names:
                 continue
 
             # Known side effects.
-            if alias.name in pathu.IMPORTS_WITH_SIDE_EFFECTS:
+            if alias.name in imports_with_side_effects:
                 return HasSideEffects.YES
 
             # [Here instead of doing that, we can make the analyzer
@@ -876,18 +989,12 @@ class SideEffectsAnalyzer(ast.NodeVisitor):
     def has_side_effects(self) -> HasSideEffects:
         return self._has_side_effects
 
-    def generic_visit(self, node):
+    def generic_visit(self, node: ast.AST) -> None:
         """Called if no explicit visitor function exists for a node
         (override)."""
         # Continue visiting if only if there's no know side effects.
         if self._has_side_effects is HasSideEffects.NO:
-            for _, value in ast.iter_fields(node):
-                if isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, ast.AST):
-                            self.visit(item)
-                elif isinstance(value, ast.AST):
-                    self.visit(value)
+            super().generic_visit(node)
 
 
 def expand_import_star(
@@ -907,8 +1014,7 @@ def expand_import_star(
 
     try:
         if mpath:
-            content, _, _ = iou.safe_read(mpath, permissions=(os.R_OK,))
-            tree = parse_ast(content, mpath)
+            tree = parse_file_ast(mpath)
 
             analyzer = ImportablesAnalyzer(mpath)
             analyzer.visit(tree)
@@ -938,10 +1044,8 @@ def expand_import_star(
 
         raise UnexpandableImportStar(path, location, msg) from err
 
-    # Create `ast.alias` for each name.
-    node.names.clear()
-    for name in importables:
-        node.names.append(ast.alias(name=name, asname=None))
+    # Create `ast.alias` for each name (in place, the list may be shared).
+    node.names[:] = [ast.alias(name=name, asname=None) for name in importables]
 
     return node
 
@@ -957,12 +1061,37 @@ def parse_ast(source_code: str, path: Path = Path(""), mode: str = "exec") -> as
         or the source contains null bytes.
     """
     try:
-        if PY38_PLUS:
-            # Include type_comments when Python >=3.8.
-            # For more information https://www.python.org/dev/peps/pep-0526/ .
-            tree = ast.parse(source_code, mode=mode, type_comments=True)
-        else:
-            tree = ast.parse(source_code, mode=mode)
-        return tree
+        # Same as `ast.parse`, without the extra call and flags computation.
+        return compile(source_code, UNKNOWN, mode, PARSE_FLAGS, dont_inherit=True)
     except (SyntaxError, IndentationError, ValueError) as err:
         raise UnparsableFile(path, err) from err
+
+
+def parse_file_ast(path: Path) -> ast.AST:
+    """Read and parse the given `path` AST.
+
+    The result is cached by the file modification time, so a module
+    star-imported from many files is read and parsed only once per run.
+    The returned tree is shared between callers and must not be modified.
+
+    :param path: `.py` file path.
+    :returns: `ast.AST` (source code AST).
+    :raises InitFileDoesNotExistError: if `path` is a missing `__init__.py`.
+    :raises ReadPermissionError: when the source does not have read permission.
+    :raises UnparsableFile: if the compiled source is invalid,
+        or the source contains null bytes.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        # Not cacheable; let `iou.safe_read` raise the proper error.
+        content, _, _ = iou.safe_read(path, permissions=(os.R_OK,))
+        return parse_ast(content, path)
+    return _parse_file_ast(path, mtime_ns)
+
+
+@lru_cache()
+def _parse_file_ast(path: Path, mtime_ns: int) -> ast.AST:
+    # `mtime_ns` is only a part of the cache key.
+    content, _, _ = iou.safe_read(path, permissions=(os.R_OK,))
+    return parse_ast(content, path)
@@ -271,6 +271,25 @@ class TestRefactor:
                 ],
                 id="both finallybody and orelse",
             ),
+            pytest.param(
+                [
+                    "def foo():\n",
+                    "    try:\n",
+                    "        pass\n",
+                    "    except Exception:\n",
+                    "        pass\n",
+                    "        x = 1\n",
+                    "    pass\n",
+                ],
+                [
+                    "def foo():\n",
+                    "    try:\n",
+                    "        pass\n",
+                    "    except Exception:\n",
+                    "        x = 1\n",
+                ],
+                id="nested handler parent - useless",
+            ),
         ],
     )
     def test_remove_useless_passes(self, source_lines, expec_lines):
@@ -655,7 +674,7 @@ class TestRefactor:
         setattr(self.configs, "expand_stars", expand_stars)
         setattr(self.configs, mode, True)
         node = Import(NodeLocation((1, 0), 1), [ast.alias(name="x", asname=None)])
-        self.session_maker._import_stats = ImportStats({node}, set())
+        self.session_maker._import_stats = ImportStats([node], [])
         with sysu.std_redirect(sysu.STD.OUT):
             with sysu.std_redirect(sysu.STD.ERR):
                 fixed_code = self.session_maker._refactor(original_lines)
@@ -697,7 +716,7 @@ class TestRefactor:
         node = Import(
             NodeLocation((1, 0), endline_no), [ast.alias(name="x", asname=None)]
         )
-        self.session_maker._import_stats = ImportStats({node}, set())
+        self.session_maker._import_stats = ImportStats([node], [])
         fixed_code = self.session_maker._refactor(original_lines)
         assert fixed_code == "".join(expec_fixed_lines)
 
@@ -727,7 +746,7 @@ class TestRefactor:
         node = Import(NodeLocation((1, 0), 1), [ast.alias(name="x", asname=None)])
         _get_used_names.return_value = _get_used_names_return
         _expand_import_star.return_value = node, is_star_return
-        self.session_maker._import_stats = ImportStats({node}, set())
+        self.session_maker._import_stats = ImportStats([node], [])
         self.session_maker._is_init_without_all = _is_init_without_all
 
         with sysu.std_redirect(sysu.STD.ERR):
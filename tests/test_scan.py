@@ -1,6 +1,7 @@
 """pycln/utils/scan.py tests."""
 # pylint: disable=R0201,W0613
 import ast
+import os
 import sys
 from importlib import import_module
 from pathlib import Path
@@ -10,7 +11,11 @@ from unittest import mock
 import pytest
 
 from pycln.utils import _nodes, scan
-from pycln.utils._exceptions import UnexpandableImportStar, UnparsableFile
+from pycln.utils._exceptions import (
+    InitFileDoesNotExistError,
+    UnexpandableImportStar,
+    UnparsableFile,
+)
 
 from .utils import sysu
 
@@ -25,13 +30,90 @@ class TestDataclasses:
     """`scan.py` dataclasses test case."""
 
     def test_import_stats_iter(self):
-        import_stats = scan.ImportStats({"import"}, {"from"})
-        assert list(import_stats) == [{"import"}, {"from"}]
+        import_stats = scan.ImportStats(["import"], ["from"])
+        assert list(import_stats) == [["import"], ["from"]]
 
     def test_source_stats_iter(self):
         source_stats = scan.SourceStats({"name"}, {"attr"}, {"skip"})
         assert list(source_stats) == [{"name"}, {"attr"}]
 
+    @pytest.mark.parametrize(
+        "stats",
+        [
+            pytest.param(scan.ImportStats([], []), id="ImportStats"),
+            pytest.param(scan.SourceStats(set(), set(), set()), id="SourceStats"),
+        ],
+    )
+    def test_stats_slots(self, stats):
+        assert not hasattr(stats, "__dict__")
+
+
+class TestDispatchNodeVisitor:
+
+    """`DispatchNodeVisitor` class tests."""
+
+    def test_dispatch(self):
+        class Visitor(scan.DispatchNodeVisitor):
+            def __init__(self):
+                super().__init__()
+                self.visited = []
+
+            def visit_Name(self, node: ast.Name):
+                self.visited.append(node.id)
+
+            def visit_NotAnASTNode(self, node):  # pragma: nocover
+                pass
+
+        visitor = Visitor()
+        assert visitor._dispatch[ast.Name] == visitor.visit_Name
+        assert "NotAnASTNode" not in {t.__name__ for t in visitor._dispatch}
+        visitor.visit(ast.parse("x = y + z"))
+        assert visitor.visited == ["x", "y", "z"]
+
+    @pytest.mark.parametrize(
+        "code, expec_fields",
+        [
+            pytest.param(
+                "for i in x:\n    pass\n",
+                (
+                    ("target", False),
+                    ("iter", False),
+                    ("body", True),
+                    ("orelse", True),
+                )
+                + ((("type_comment", False),) if PY38_PLUS else ()),
+                id="list and node fields",
+            ),
+            pytest.param(
+                "import x as y\n", (("names", True),), id="skip scalar fields"
+            ),
+        ],
+    )
+    def test_get_child_fields(self, code, expec_fields):
+        node = ast.parse(code).body[0]
+        assert scan.get_child_fields(node) == expec_fields
+
+    def test_get_child_fields_missing_field(self):
+        class Node(ast.AST):
+            _fields = ("body", "value")
+
+        node = Node()
+        node.value = ast.Name(id="x", ctx=ast.Load())
+        assert scan.get_child_fields(node) == (("value", False),)
+        assert Node not in scan._CHILD_FIELDS
+
+        full_node = Node()
+        full_node.body = [ast.Pass()]
+        full_node.value = None
+        expec_fields = (("body", True), ("value", False))
+        assert scan.get_child_fields(full_node) == expec_fields
+        assert scan._CHILD_FIELDS[Node] == expec_fields
+
+        # Nodes of an already classified type may still miss fields.
+        visitor = scan.DispatchNodeVisitor()
+        visitor.visit(node)
+        visitor.visit(full_node)
+
 
 class AnalyzerTestCase:
 
@@ -923,15 +1005,20 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
 
     """`ImportablesAnalyzer` class tests."""
 
-    def _assert_not_importables(self, not_importables: set, expec_not_importables: set):
-        str_set = {(n.id if hasattr(n, "id") else n) for n in not_importables}
+    def _assert_not_importables(
+        self, tree: ast.AST, not_importables: set, expec_not_importables: set
+    ):
+        # Map the `id()` of not-importable assignment targets back to names.
+        names = {id(n): n.id for n in ast.walk(tree) if isinstance(n, ast.Name)}
+        str_set = {names.get(n, n) for n in not_importables}
         assert str_set == expec_not_importables
 
     def _assert_importables_and_not(
         self, code: str, expec_importables: set, expec_not_importables=frozenset()
     ):
         analyzer = scan.ImportablesAnalyzer(Path(__file__))
-        analyzer.visit(ast.parse(code))
+        tree = ast.parse(code)
+        analyzer.visit(tree)
         importables = analyzer.get_stats()
         if expec_importables:
             assert self.normalize_set(importables) == self.normalize_set(
@@ -939,7 +1026,9 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
             )
         else:
             assert importables
-        self._assert_not_importables(analyzer._not_importables, expec_not_importables)
+        self._assert_not_importables(
+            tree, analyzer._not_importables, expec_not_importables
+        )
 
     @pytest.mark.parametrize(
         "code, expec_importables",
@@ -1109,8 +1198,11 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
     )
     def test_compute_not_importables(self, code, expec_not_importables):
         analyzer = scan.ImportablesAnalyzer(Path(""))
-        analyzer._compute_not_importables(ast.parse(code).body[0])
-        self._assert_not_importables(analyzer._not_importables, expec_not_importables)
+        tree = ast.parse(code)
+        analyzer._compute_not_importables(tree.body[0])
+        self._assert_not_importables(
+            tree, analyzer._not_importables, expec_not_importables
+        )
 
 
 class TestSideEffectsAnalyzer:
@@ -1208,6 +1300,11 @@ class TestSideEffectsAnalyzer:
     def test_visit_Call(self, code, expec_has_side_effects):
         self._assert_has_side_effects_and_not(code, expec_has_side_effects)
 
+    def test_visit_not_module(self):
+        analyzer = scan.SideEffectsAnalyzer()
+        analyzer.visit(ast.parse("x = print()\n").body[0])
+        assert analyzer.has_side_effects() is scan.HasSideEffects.YES
+
     @pytest.mark.parametrize(
         "code, expec_has_side_effects",
         [
@@ -1221,6 +1318,11 @@ class TestSideEffectsAnalyzer:
                 scan.HasSideEffects.YES,
                 id="known imports with side effects",
             ),
+            pytest.param(
+                "import antigravity\nimport os\n",
+                scan.HasSideEffects.YES,
+                id="known imports with side effects - followed by standard",
+            ),
             pytest.param(
                 "import unknown\n",
                 scan.HasSideEffects.MAYBE,
@@ -1332,6 +1434,14 @@ class TestScanFunctions(AnalyzerTestCase):
             node = ast.parse("from pycln import *\n").body[0]
             scan.expand_import_star(node, Path(__file__))
 
+    @mock.patch(MOCK % "pathu.get_import_from_path")
+    def test_expand_import_star_missing_init(self, get_import_from_path):
+        # Namespace packages resolve to a missing `__init__.py`.
+        get_import_from_path.return_value = Path("DoesNotExist", "__init__.py")
+        with pytest.raises(InitFileDoesNotExistError):
+            node = ast.parse("from DoesNotExist import *\n").body[0]
+            scan.expand_import_star(node, Path(__file__))
+
     def _assert_ast_equal(
         self,
         code: str,
@@ -1423,3 +1533,35 @@ class TestScanFunctions(AnalyzerTestCase):
     )
     def test_parse_ast_py37_minus(self, code, mode, expec_err_type):
         self._assert_ast_equal(code, mode, expec_err_type)
+
+    def test_parse_file_ast(self):
+        with sysu.reopenable_temp_file("x = 1\n") as tmp_path:
+            tree = scan.parse_file_ast(tmp_path)
+            assert scan.parse_file_ast(tmp_path) is tree
+
+            # A modified file should be parsed again.
+            with open(tmp_path, "w") as tmp:
+                tmp.write("y = 2\n")
+            mtime_ns = os.stat(tmp_path).st_mtime_ns + 1
+            os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+            new_tree = scan.parse_file_ast(tmp_path)
+            assert new_tree is not tree
+            assert new_tree.body[0].targets[0].id == "y"
+
+    def test_parse_file_ast_nested_star(self, tmp_path):
+        # Expanding a nested import star mustn't modify the cached tree.
+        tmp_path.joinpath("d.py").write_text("from .c import *\nz = 1\n")
+        c_path = tmp_path.joinpath("c.py")
+        c_path.write_text("import os\nw = 1\n")
+        path = tmp_path.joinpath("main.py")
+
+        node = ast.parse("from .d import *\n").body[0]
+        names = {a.name for a in scan.expand_import_star(node, path).names}
+        assert names == {"os", "w", "z"}
+
+        c_path.write_text("v = 1\n")
+        mtime_ns = os.stat(c_path).st_mtime_ns + 1
+        os.utime(c_path, ns=(mtime_ns, mtime_ns))
+        node = ast.parse("from .d import *\n").body[0]
+        names = {a.name for a in scan.expand_import_star(node, path).names}
+        assert names == {"v", "z"}